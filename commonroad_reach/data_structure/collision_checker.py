@@ -33,6 +33,10 @@ class CollisionChecker:
         logger.debug("CollisionChecker initialized.")
 
     def _initialize(self):
+        # collision checker sliced at the most recently queried step, reset as it refers to the previous checker
+        self._step_time_slice = None
+        self._collision_checker_time_slice = None
+
         if self.config.planning.coordinate_system == "CART":
             self.cpp_collision_checker = self._create_cartesian_collision_checker()
 
@@ -230,19 +234,22 @@ class CollisionChecker:
         """
         Returns true if the input rectangle collides with obstacles in the scenario at the given step.
 
-        Creating a query windows significantly decreases computation time.
+        Creating a query windows significantly decreases computation time. The collision checker is sliced only once
+        for consecutive queries at the same step, e.g., for all rectangles of a drivable area and their splits.
         """
         # convert to collision object
         rect_collision = self.convert_reach_polygon_to_collision_object(input_rectangle)
 
-        # create a query window, decreases computation time
-        collision_checker = self.cpp_collision_checker.window_query(rect_collision)
-
         # slice collision checker with time
-        collision_checker_time_slice = collision_checker.time_slice(step)
+        if step != self._step_time_slice:
+            self._collision_checker_time_slice = self.cpp_collision_checker.time_slice(step)
+            self._step_time_slice = step
+
+        # create a query window, decreases computation time
+        collision_checker = self._collision_checker_time_slice.window_query(rect_collision)
 
         # return collision result
-        return collision_checker_time_slice.collide(rect_collision)
+        return collision_checker.collide(rect_collision)
 
     @staticmethod
     def convert_reach_polygon_to_collision_object(input_rectangle: ReachPolygon) -> pycrcc.RectAABB:
@@ -1,9 +1,13 @@
 import os
+import sys
 import copy
 import logging
+from functools import cached_property, lru_cache
+from operator import attrgetter
+from types import SimpleNamespace
 from typing import Optional, Union, Tuple, List
 import yaml
-from omegaconf import ListConfig, DictConfig
+from omegaconf import ListConfig, DictConfig, OmegaConf
 
 import numpy as np
 from commonroad.common.file_reader import CommonRoadFileReader
@@ -11,12 +15,8 @@ from commonroad.scenario.scenario import Scenario
 from commonroad.scenario.trajectory import State
 from commonroad.planning.goal import GoalRegion
 from commonroad.planning.planning_problem import PlanningProblem, PlanningProblemSet
-from commonroad.common.solution import VehicleType
-from commonroad_reach import pycrreach
-from commonroad_dc.feasibility.vehicle_dynamics import VehicleParameterMapping
 from commonroad_dc.pycrccosy import CurvilinearCoordinateSystem
 from commonroad_dc.geometry.util import resample_polyline
-from commonroad_route_planner.route_planner import RoutePlanner
 
 import commonroad_reach.utility.logger as util_logger
 from commonroad_reach.utility import configuration as util_configuration
@@ -24,6 +24,85 @@ from commonroad_reach.utility import general as util_general
 
 logger = logging.getLogger(__name__)
 
+# names of the corresponding enum members in pycrreach
+_DICT_COORDINATE_SYSTEM_TO_CPP = {"CART": "CARTESIAN", "CVLN": "CURVILINEAR"}
+_DICT_REFERENCE_POINT_TO_CPP = {"CENTER": "CENTER", "REAR": "REAR"}
+
+_DICT_CLCS_TO_STRING = {"CART": "cartesian", "CVLN": "curvilinear"}
+_DICT_MODE_COMPUTATION_TO_STRING = {1: "polytopic, python backend", 2: "polytopic, c++ backend",
+                                    3: "graph-based (online)", 4: "graph-based (offline)"}
+_DICT_MODE_REPARTITION_TO_STRING = {1: "repartition, collision check", 2: "collision check, repartition",
+                                    3: "repartition, collision check, then repartition"}
+_DICT_MODE_INFLATION_TO_STRING = {1: "inscribed circle", 2: "circumscribed circle",
+                                  3: "three circle approximation"}
+
+_TEMPLATE_CONFIGURATION_SUMMARY = "\n".join([
+    "",
+    "# ===== CommonRoad-Reach Configuration Summary ===== #",
+    "# {scenario_id}",
+    "# Planning:",
+    "# \tdt: {dt}",
+    "# \tsteps: {steps}",
+    "# \tcoordinate system: {CLCS}",
+    "# Vehicle (Ego):",
+    "# \tvehicle type id: {ego.id_type_vehicle}",
+    "# \tv: lon_min = {ego.v_lon_min}, lon_max = {ego.v_lon_max}, "
+    "lat_min = {ego.v_lat_min}, lat_max = {ego.v_lat_max}, max = {ego.v_max}",
+    "# \ta: lon_min = {ego.a_lon_min}, lon_max = {ego.a_lon_max}, "
+    "lat_min = {ego.a_lat_min}, lat_max = {ego.a_lat_max}, max = {ego.a_max}",
+    "# Reachable set:",
+    "# \tcomputation mode: {mode_computation}",
+    "# \trepartition mode: {mode_repartition}",
+    "# \tinflation mode: {mode_inflation}",
+    "# \tobstacle rasterization: {reachable_set.rasterize_obstacles}",
+    "# \tgrid size: {reachable_set.size_grid}",
+    "# \tsplit radius: {reachable_set.radius_terminal_split}",
+    "# \tprune: {reachable_set.prune_nodes_not_reaching_final_step}",
+    "# \tnum threads: {reachable_set.num_threads}",
+    "# ================================= #"])
+
+_FIELDS_CPP_VEHICLE = ("id_type_vehicle", "length", "width", "radius_disc", "circle_distance", "wheelbase",
+                       "v_lon_min", "v_lon_max", "v_lat_min", "v_lat_max",
+                       "a_lon_min", "a_lon_max", "a_lat_min", "a_lat_max", "a_max")
+
+# section of the C++ configuration -> pairs of (key in C++ configuration, attribute of Python sub-configuration)
+_FIELDS_CPP_CONFIGURATION = {
+    "vehicle": tuple((field, field) for field in _FIELDS_CPP_VEHICLE),
+    "planning": tuple((field, field) for field in
+                      ("dt", "step_start", "steps_computation",
+                       "p_lon_initial", "p_lat_initial", "uncertainty_p_lon", "uncertainty_p_lat",
+                       "v_lon_initial", "v_lat_initial", "uncertainty_v_lon", "uncertainty_v_lat")),
+    "reachable_set": (("mode_repartition", "mode_repartition"),
+                      ("mode_inflation", "mode_inflation"),
+                      ("size_grid", "size_grid"),
+                      ("size_grid_2nd", "size_grid_2nd"),
+                      ("radius_terminal_split", "radius_terminal_split"),
+                      ("num_threads", "num_threads"),
+                      ("prune_nodes", "prune_nodes_not_reaching_final_step"),
+                      ("rasterize_obstacles", "rasterize_obstacles"))
+}
+
+# getters are built once at import time; attrgetter reads all attributes of a sub-configuration in a single call
+_GETTERS_CPP_CONFIGURATION = {
+    section: (tuple(key for key, _ in fields), attrgetter(*(name for _, name in fields)))
+    for section, fields in _FIELDS_CPP_CONFIGURATION.items()
+}
+
+
+def _section_to_cpp_dict(config_section, section: str) -> dict:
+    keys, getter = _GETTERS_CPP_CONFIGURATION[section]
+    return dict(zip(keys, getter(config_section)))
+
+
+def _freeze_to_namespace(obj):
+    """
+    Recursively converts dictionaries into namespaces so that values can be read via plain attribute access.
+    """
+    if isinstance(obj, dict):
+        return SimpleNamespace(**{key: _freeze_to_namespace(value) for key, value in obj.items()})
+
+    return obj
+
 
 class Configuration:
     """
@@ -32,16 +111,29 @@ class Configuration:
 
     def __init__(self, config_omega: Union[ListConfig, DictConfig]):
         self.config_omega = config_omega
-        self.name_scenario = config_omega.general.name_scenario
+        # resolved once into plain namespaces, from which all sub-configurations are read
+        self._config_frozen = _freeze_to_namespace(OmegaConf.to_container(config_omega, resolve=True,
+                                                                          throw_on_missing=True))
+        self.name_scenario = self._config_frozen.general.name_scenario
         self.scenario: Optional[Scenario] = None
         self.planning_problem: Optional[PlanningProblem] = None
         self.planning_problem_set: Optional[PlanningProblemSet] = None
+        # instantiated upon construction so that invalid parameters, e.g., an unknown vehicle type, raise right away
+        self.planning: PlanningConfiguration = PlanningConfiguration(self._config_frozen)
+        self.vehicle: VehicleConfiguration = VehicleConfiguration(self._config_frozen)
 
-        self.general: GeneralConfiguration = GeneralConfiguration(config_omega)
-        self.planning: PlanningConfiguration = PlanningConfiguration(config_omega)
-        self.vehicle: VehicleConfiguration = VehicleConfiguration(config_omega)
-        self.reachable_set: ReachableSetConfiguration = ReachableSetConfiguration(config_omega)
-        self.debug: DebugConfiguration = DebugConfiguration(config_omega)
+    # the remaining sub-configurations are only instantiated upon first access
+    @cached_property
+    def general(self) -> "GeneralConfiguration":
+        return GeneralConfiguration(self._config_frozen)
+
+    @cached_property
+    def reachable_set(self) -> "ReachableSetConfiguration":
+        return ReachableSetConfiguration(self._config_frozen)
+
+    @cached_property
+    def debug(self) -> "DebugConfiguration":
+        return DebugConfiguration(self._config_frozen)
 
     def __repr__(self):
         return f"Configuration(scenario_id={self.scenario.scenario_id}," \
@@ -90,51 +182,34 @@ class Configuration:
 
         self.reachable_set.update_configuration(self)
 
-    def print_configuration_summary(self):
+    def print_configuration_summary(self, verbose: bool = True):
         """
         Prints a summary of the configuration.
+
+        :param verbose: whether to print the summary, it is logged regardless
         """
-        dict_clcs_to_string = {"CART": "cartesian", "CVLN": "curvilinear"}
-        dict_mode_computation_to_string = {1: "polytopic, python backend", 2: "polytopic, c++ backend",
-                                           3: "graph-based (online)", 4: "graph-based (offline)"}
-        dict_mode_repartition_to_string = {1: "repartition, collision check", 2: "collision check, repartition",
-                                           3: "repartition, collision check, then repartition"}
-        dict_mode_inflation_to_string = {1: "inscribed circle", 2: "circumscribed circle",
-                                         3: "three circle approximation"}
-
-        CLCS = dict_clcs_to_string[self.planning.coordinate_system]
-        mode_computation = dict_mode_computation_to_string[self.reachable_set.mode_computation]
-        mode_repartition = dict_mode_repartition_to_string[self.reachable_set.mode_repartition]
-        mode_inflation = dict_mode_inflation_to_string[self.reachable_set.mode_inflation]
-
-        string = "\n# ===== CommonRoad-Reach Configuration Summary ===== #\n"
-        string += f"# {self.scenario.scenario_id}\n"
-        string += "# Planning:\n"
-        string += f"# \tdt: {self.planning.dt}\n"
-        string += f"# \tsteps: {self.planning.steps_computation}\n"
-        string += f"# \tcoordinate system: {CLCS}\n"
-
-        config_ego = self.vehicle.ego
-        string += "# Vehicle (Ego):\n"
-        string += f"# \tvehicle type id: {self.vehicle.ego.id_type_vehicle}\n"
-        string += f"# \tv: lon_min = {config_ego.v_lon_min}, lon_max = {config_ego.v_lon_max}, " \
-                  f"lat_min = {config_ego.v_lat_min}, lat_max = {config_ego.v_lat_max}, max = {config_ego.v_max}\n"
-        string += f"# \ta: lon_min = {config_ego.a_lon_min}, lon_max = {config_ego.a_lon_max}, " \
-                  f"lat_min = {config_ego.a_lat_min}, lat_max = {config_ego.a_lat_max}, max = {config_ego.a_max}\n"
-
-        string += "# Reachable set:\n"
-        string += f"# \tcomputation mode: {mode_computation}\n"
-        string += f"# \trepartition mode: {mode_repartition}\n"
-        string += f"# \tinflation mode: {mode_inflation}\n"
-        string += f"# \tobstacle rasterization: {self.reachable_set.rasterize_obstacles}\n"
-        string += f"# \tgrid size: {self.reachable_set.size_grid}\n"
-        string += f"# \tsplit radius: {self.reachable_set.radius_terminal_split}\n"
-        string += f"# \tprune: {self.reachable_set.prune_nodes_not_reaching_final_step}\n"
-        string += f"# \tnum threads: {self.reachable_set.num_threads}\n"
-        string += "# ================================= #"
-
-        for line in string.split("\n"):
-            util_logger.print_and_log_info(logger, line)
+        # skip building the summary if it would neither be printed nor logged
+        if not verbose and not logger.isEnabledFor(logging.INFO):
+            return
+
+        CLCS = _DICT_CLCS_TO_STRING.get(self.planning.coordinate_system, "undefined")
+        mode_computation = _DICT_MODE_COMPUTATION_TO_STRING.get(self.reachable_set.mode_computation, "undefined")
+        mode_repartition = _DICT_MODE_REPARTITION_TO_STRING.get(self.reachable_set.mode_repartition, "undefined")
+        mode_inflation = _DICT_MODE_INFLATION_TO_STRING.get(self.reachable_set.mode_inflation, "undefined")
+
+        string = _TEMPLATE_CONFIGURATION_SUMMARY.format_map({
+            "scenario_id": self.scenario.scenario_id,
+            "dt": self.planning.dt,
+            "steps": self.planning.steps_computation,
+            "CLCS": CLCS,
+            "ego": self.vehicle.ego,
+            "mode_computation": mode_computation,
+            "mode_repartition": mode_repartition,
+            "mode_inflation": mode_inflation,
+            "reachable_set": self.reachable_set})
+
+        # print and log the summary at once instead of line by line
+        util_logger.print_and_log_info(logger, string, verbose)
 
     def save(self, path_save: str, name_file: str):
         """
@@ -142,100 +217,46 @@ class Configuration:
         """
         dict_save = {"name_scenario": self.name_scenario}
 
-        for name_obj, obj in self.__dict__.items():
-            try:
-                dict_obj = obj.to_dict()
-
-            except AttributeError:
-                continue
-
-            else:
-                dict_save.update({name_obj: dict_obj})
+        for name_obj in ("general", "planning", "vehicle", "reachable_set", "debug"):
+            dict_save.update({name_obj: getattr(self, name_obj).to_dict()})
 
         with open(f'{path_save}/{name_file}.yml', 'w') as file_yaml:
             yaml.dump(dict_save, file_yaml, default_flow_style=False, allow_unicode=True)
 
-    def convert_to_cpp_configuration(self) -> pycrreach.Configuration:
+    def convert_to_cpp_configuration(self) -> "pycrreach.Configuration":
         """
         Converts to a configuration that is readable by the C++ binding code.
-        """
-        config = pycrreach.Configuration()
-
-        config.general.name_scenario = self.name_scenario
-        config.general.path_scenarios = self.general.path_scenarios
-
-        config.vehicle.ego.id_type_vehicle = self.vehicle.ego.id_type_vehicle
-        config.vehicle.ego.length = self.vehicle.ego.length
-        config.vehicle.ego.width = self.vehicle.ego.width
-        config.vehicle.ego.v_lon_min = self.vehicle.ego.v_lon_min
-        config.vehicle.ego.v_lon_max = self.vehicle.ego.v_lon_max
-        config.vehicle.ego.v_lat_min = self.vehicle.ego.v_lat_min
-        config.vehicle.ego.v_lat_max = self.vehicle.ego.v_lat_max
-        config.vehicle.ego.a_lon_min = self.vehicle.ego.a_lon_min
-        config.vehicle.ego.a_lon_max = self.vehicle.ego.a_lon_max
-        config.vehicle.ego.a_lat_min = self.vehicle.ego.a_lat_min
-        config.vehicle.ego.a_lat_max = self.vehicle.ego.a_lat_max
-        config.vehicle.ego.a_max = self.vehicle.ego.a_max
-        config.vehicle.ego.radius_disc = self.vehicle.ego.radius_disc
-        config.vehicle.ego.circle_distance = self.vehicle.ego.circle_distance
-        config.vehicle.ego.wheelbase = self.vehicle.ego.wheelbase
-
-        config.vehicle.other.id_type_vehicle = self.vehicle.other.id_type_vehicle
-        config.vehicle.other.length = self.vehicle.other.length
-        config.vehicle.other.width = self.vehicle.other.width
-        config.vehicle.other.v_lon_min = self.vehicle.other.v_lon_min
-        config.vehicle.other.v_lon_max = self.vehicle.other.v_lon_max
-        config.vehicle.other.v_lat_min = self.vehicle.other.v_lat_min
-        config.vehicle.other.v_lat_max = self.vehicle.other.v_lat_max
-        config.vehicle.other.a_lon_min = self.vehicle.other.a_lon_min
-        config.vehicle.other.a_lon_max = self.vehicle.other.a_lon_max
-        config.vehicle.other.a_lat_min = self.vehicle.other.a_lat_min
-        config.vehicle.other.a_lat_max = self.vehicle.other.a_lat_max
-        config.vehicle.other.a_max = self.vehicle.other.a_max
-        config.vehicle.other.radius_disc = self.vehicle.other.radius_disc
-        config.vehicle.other.circle_distance = self.vehicle.other.circle_distance
-        config.vehicle.other.wheelbase = self.vehicle.other.wheelbase
-
-        config.planning.dt = self.planning.dt
-        config.planning.step_start = self.planning.step_start
-        config.planning.steps_computation = self.planning.steps_computation
-        config.planning.p_lon_initial = self.planning.p_lon_initial
-        config.planning.p_lat_initial = self.planning.p_lat_initial
-        config.planning.uncertainty_p_lon = self.planning.uncertainty_p_lon
-        config.planning.uncertainty_p_lat = self.planning.uncertainty_p_lat
-        config.planning.v_lon_initial = self.planning.v_lon_initial
-        config.planning.v_lat_initial = self.planning.v_lat_initial
-        config.planning.uncertainty_v_lon = self.planning.uncertainty_v_lon
-        config.planning.uncertainty_v_lat = self.planning.uncertainty_v_lat
-
-        if self.planning.coordinate_system == "CART":
-            config.planning.coordinate_system = pycrreach.CoordinateSystem.CARTESIAN
-
-        else:
-            config.planning.coordinate_system = pycrreach.CoordinateSystem.CURVILINEAR
-            config.planning.CLCS = self.planning.CLCS
-
-        if self.planning.reference_point == "REAR":
-            config.planning.reference_point = pycrreach.ReferencePoint.REAR
-
-        else:
-            config.planning.reference_point = pycrreach.ReferencePoint.CENTER
 
-        config.reachable_set.mode_repartition = self.reachable_set.mode_repartition
-        config.reachable_set.mode_inflation = self.reachable_set.mode_inflation
-        config.reachable_set.size_grid = self.reachable_set.size_grid
-        config.reachable_set.size_grid_2nd = self.reachable_set.size_grid_2nd
-        config.reachable_set.radius_terminal_split = self.reachable_set.radius_terminal_split
-        config.reachable_set.num_threads = self.reachable_set.num_threads
-        config.reachable_set.prune_nodes = self.reachable_set.prune_nodes_not_reaching_final_step
-        config.reachable_set.rasterize_obstacles = self.reachable_set.rasterize_obstacles
+        All values are collected into a nested dictionary, which is unpacked on the C++ side in a single call.
+        """
+        # imported here as the C++ extension is only required by the C++ backend
+        from commonroad_reach import pycrreach
+
+        config_vehicle = self.vehicle
+        config_planning = self.planning
+        config_reachable_set = self.reachable_set
+
+        dict_config = {"general": {"name_scenario": self.name_scenario,
+                                   "path_scenarios": self.general.path_scenarios},
+                       "vehicle": {"ego": _section_to_cpp_dict(config_vehicle.ego, "vehicle"),
+                                   "other": _section_to_cpp_dict(config_vehicle.other, "vehicle")},
+                       "planning": _section_to_cpp_dict(config_planning, "planning"),
+                       "reachable_set": _section_to_cpp_dict(config_reachable_set, "reachable_set")}
+
+        dict_planning = dict_config["planning"]
+        dict_planning["coordinate_system"] = \
+            getattr(pycrreach.CoordinateSystem, _DICT_COORDINATE_SYSTEM_TO_CPP[config_planning.coordinate_system])
+        dict_planning["reference_point"] = \
+            getattr(pycrreach.ReferencePoint, _DICT_REFERENCE_POINT_TO_CPP[config_planning.reference_point])
+        if config_planning.coordinate_system == "CVLN":
+            dict_planning["CLCS"] = config_planning.CLCS
 
         # convert lut dict to Cpp configuration via PyBind function
-        if self.reachable_set.mode_inflation == 3:
-            config.reachable_set.lut_lon_enlargement = \
-                pycrreach.LUTLongitudinalEnlargement(self.reachable_set.lut_longitudinal_enlargement)
+        if config_reachable_set.mode_inflation == 3:
+            dict_config["reachable_set"]["lut_lon_enlargement"] = \
+                pycrreach.LUTLongitudinalEnlargement(config_reachable_set.lut_longitudinal_enlargement)
 
-        return config
+        return pycrreach.Configuration.from_dict(dict_config)
 
     def clone(self):
         config_cloned = Configuration(self.config_omega)
@@ -272,70 +293,118 @@ class ConfigurationBase:
 
 
 class GeneralConfiguration(ConfigurationBase):
-    def __init__(self, config: Union[ListConfig, DictConfig]):
-        config_relevant = config.general
-        name_scenario = config_relevant.name_scenario
+    def __init__(self, config: SimpleNamespace):
+        config_relevant = vars(config.general)
+        name_scenario = config_relevant["name_scenario"]
 
-        self.path_scenarios = config_relevant.path_scenarios
-        self.path_scenario = config_relevant.path_scenarios + name_scenario + ".xml"
-        self.path_output = config_relevant.path_output + name_scenario + "/"
-        self.path_logs = config_relevant.path_logs
-        self.path_offline_data = config_relevant.path_offline_data
-        self.path_pickles = config_relevant.path_pickles
+        self.path_scenarios = config_relevant["path_scenarios"]
+        self.path_scenario, self.path_output = \
+            _construct_paths_of_scenario(config_relevant["path_scenarios"], config_relevant["path_output"],
+                                         name_scenario)
+        self.path_logs = config_relevant["path_logs"]
+        self.path_offline_data = config_relevant["path_offline_data"]
+        self.path_pickles = config_relevant["path_pickles"]
 
 
-class VehicleConfiguration(ConfigurationBase):
-    class Ego:
-        def __init__(self, config: Union[ListConfig, DictConfig]):
-            config_relevant = config.vehicle.ego
+@lru_cache(128)
+def _construct_paths_of_scenario(path_scenarios: str, path_output: str, name_scenario: str) -> Tuple[str, str]:
+    """
+    Returns the path to the scenario file and the output directory of the scenario.
 
-            self.id_type_vehicle = config_relevant.id_type_vehicle
+    Only the immutable path strings are cached, the configuration objects themselves are not shared.
+    """
+    return os.path.join(path_scenarios, name_scenario + ".xml"), os.path.join(path_output, name_scenario, "")
 
-            # load vehicle parameters according to id_type_vehicle
-            try:
-                vehicle_parameters = VehicleParameterMapping.from_vehicle_type(VehicleType(self.id_type_vehicle))
 
-            except KeyError:
-                raise Exception(f"Given vehicle type id {self.id_type_vehicle} is not valid.")
+@lru_cache(16)
+def _retrieve_vehicle_parameters(id_type_vehicle: int) -> dict:
+    """
+    Returns the default parameters of a vehicle configuration taken from the CommonRoad vehicle model with the given
+    type id.
 
-            self.length = vehicle_parameters.l
-            self.width = vehicle_parameters.w
+    The returned dictionary is shared among all vehicle configurations and must thus not be modified.
+    """
+    from commonroad.common.solution import VehicleType
+    from commonroad_dc.feasibility.vehicle_dynamics import VehicleParameterMapping
 
-            self.v_lon_min = vehicle_parameters.longitudinal.v_min
-            self.v_lon_max = vehicle_parameters.longitudinal.v_max
-            # not present in vehicle parameters
-            self.v_lat_min = None
-            self.v_lat_max = None
-            self.v_max = vehicle_parameters.longitudinal.v_max
+    vehicle_parameters = VehicleParameterMapping.from_vehicle_type(VehicleType(id_type_vehicle))
+    parameters_longitudinal = vehicle_parameters.longitudinal
 
-            self.a_lon_min = -vehicle_parameters.longitudinal.a_max
-            self.a_lon_max = vehicle_parameters.longitudinal.a_max
+    return {"length": vehicle_parameters.l,
+            "width": vehicle_parameters.w,
+            "v_lon_min": parameters_longitudinal.v_min,
+            "v_lon_max": parameters_longitudinal.v_max,
             # not present in vehicle parameters
-            self.a_lat_min = None
-            self.a_lat_max = None
-            self.a_max = vehicle_parameters.longitudinal.a_max
-
+            "v_lat_min": None,
+            "v_lat_max": None,
+            "v_max": parameters_longitudinal.v_max,
+            "a_lon_min": -parameters_longitudinal.a_max,
+            "a_lon_max": parameters_longitudinal.a_max,
+            # not present in vehicle parameters
+            "a_lat_min": None,
+            "a_lat_max": None,
+            "a_max": parameters_longitudinal.a_max,
             # distances front/rear axle to vehicle center
-            self.wb_front_axle = vehicle_parameters.a
-            self.wb_rear_axle = vehicle_parameters.b
+            "wb_front_axle": vehicle_parameters.a,
+            "wb_rear_axle": vehicle_parameters.b}
+
+
+def _initialize_vehicle_parameters(config_vehicle, config_relevant: dict):
+    """
+    Sets the parameters of a vehicle configuration based on the CommonRoad vehicle model given by id_type_vehicle.
+
+    Parameters explicitly provided in the *.yaml file overwrite those of the vehicle model.
+    """
+    id_type_vehicle = config_relevant["id_type_vehicle"]
+
+    # load vehicle parameters according to id_type_vehicle
+    try:
+        dict_parameters = {"id_type_vehicle": id_type_vehicle, **_retrieve_vehicle_parameters(id_type_vehicle)}
 
-            # overwrite with parameters given by vehicle ID if they are explicitly provided in the *.yaml file
-            for key, value in config_relevant.items():
-                if value is not None:
-                    setattr(self, key, value)
+    except KeyError:
+        raise Exception(f"Given vehicle type id {id_type_vehicle} is not valid.")
 
-            # wheelbase
-            self.wheelbase = self.wb_front_axle + self.wb_rear_axle
+    # keys that are not parameters of the vehicle model are still set, but might be misspelled parameters
+    list_keys_unknown = sorted(config_relevant.keys() - dict_parameters.keys())
+    if list_keys_unknown:
+        util_logger.print_and_log_warning(logger, f"Unknown vehicle parameters in the *.yaml file: "
+                                                  f"{', '.join(list_keys_unknown)}.")
 
-            self.radius_disc, self.circle_distance = \
-                util_configuration.compute_disc_radius_and_distance(self.length, self.width,
-                                                                    ref_point=config.planning.reference_point,
-                                                                    dist_axle_rear=self.wb_rear_axle)
+    # overwrite with parameters given by vehicle ID if they are explicitly provided in the *.yaml file
+    dict_parameters.update({key: value for key, value in config_relevant.items() if value is not None})
+
+    for key, value in dict_parameters.items():
+        setattr(config_vehicle, key, value)
+
+
+def _compute_derived_vehicle_parameters(config_vehicle, config: SimpleNamespace):
+    """
+    Computes the wheelbase, disc approximation and inflation radius of a vehicle configuration.
+
+    Called only after all parameters from the vehicle model and the *.yaml file are set, so that each value is
+    computed once from the final dimensions.
+    """
+    config_vehicle.wheelbase = config_vehicle.wb_front_axle + config_vehicle.wb_rear_axle
+
+    config_vehicle.radius_disc, config_vehicle.circle_distance = \
+        util_configuration.compute_disc_radius_and_distance(config_vehicle.length, config_vehicle.width,
+                                                            ref_point=config.planning.reference_point,
+                                                            dist_axle_rear=config_vehicle.wb_rear_axle)
+
+    config_vehicle.radius_inflation = util_configuration.compute_inflation_radius(config.reachable_set.mode_inflation,
+                                                                                  config_vehicle.length,
+                                                                                  config_vehicle.width,
+                                                                                  config_vehicle.radius_disc)
+
+
+class VehicleConfiguration(ConfigurationBase):
+    class Ego:
+        def __init__(self, config: SimpleNamespace):
+            _initialize_vehicle_parameters(self, vars(config.vehicle.ego))
             assert not (config.planning.reference_point == "REAR" and config.reachable_set.mode_inflation == 2), \
                 "Circumscribed inflation only supports reference point CENTER"
-            self.radius_inflation = util_configuration.compute_inflation_radius(config.reachable_set.mode_inflation,
-                                                                                self.length, self.width,
-                                                                                self.radius_disc)
+            _compute_derived_vehicle_parameters(self, config)
+
             self.update_configuration(config)
 
         def update_configuration(self, config):
@@ -347,55 +416,11 @@ class VehicleConfiguration(ConfigurationBase):
                 self.a_lon_max = self.a_lat_max = self.a_max
 
     class Other:
-        def __init__(self, config: Union[ListConfig, DictConfig]):
-            config_relevant = config.vehicle.other
-
-            self.id_type_vehicle = config_relevant.id_type_vehicle
-            # load vehicle parameters according to id_type_vehicle
-            try:
-                vehicle_parameters = VehicleParameterMapping.from_vehicle_type(VehicleType(self.id_type_vehicle))
-
-            except KeyError:
-                raise Exception(f"Given vehicle type id {self.id_type_vehicle} is not valid.")
-
-            self.length = vehicle_parameters.l
-            self.width = vehicle_parameters.w
+        def __init__(self, config: SimpleNamespace):
+            _initialize_vehicle_parameters(self, vars(config.vehicle.other))
+            _compute_derived_vehicle_parameters(self, config)
 
-            self.v_lon_min = vehicle_parameters.longitudinal.v_min
-            self.v_lon_max = vehicle_parameters.longitudinal.v_max
-            # not present in vehicle parameters
-            self.v_lat_min = None
-            self.v_lat_max = None
-            self.v_max = vehicle_parameters.longitudinal.v_max
-
-            self.a_lon_min = -vehicle_parameters.longitudinal.a_max
-            self.a_lon_max = vehicle_parameters.longitudinal.a_max
-            # not present in vehicle parameters
-            self.a_lat_min = None
-            self.a_lat_max = None
-            self.a_max = vehicle_parameters.longitudinal.a_max
-
-            # distances front/rear axle to vehicle center
-            self.wb_front_axle = vehicle_parameters.a
-            self.wb_rear_axle = vehicle_parameters.b
-            # wheelbase
-            self.wheelbase = self.wb_front_axle + self.wb_rear_axle
-
-            # overwrite with parameters in the config file
-            for key, value in config_relevant.items():
-                if value is not None:
-                    setattr(self, key, value)
-
-            self.radius_disc, self.circle_distance = \
-                util_configuration.compute_disc_radius_and_distance(self.length, self.width,
-                                                                    ref_point=config.planning.reference_point,
-                                                                    dist_axle_rear=self.wb_rear_axle)
-
-            self.radius_inflation = util_configuration.compute_inflation_radius(config.reachable_set.mode_inflation,
-                                                                                self.length, self.width,
-                                                                                self.radius_disc)
-
-    def __init__(self, config: Union[ListConfig, DictConfig]):
+    def __init__(self, config: SimpleNamespace):
         self.ego = VehicleConfiguration.Ego(config)
         self.other = VehicleConfiguration.Other(config)
 
@@ -422,21 +447,21 @@ class VehicleConfiguration(ConfigurationBase):
 
 
 class PlanningConfiguration(ConfigurationBase):
-    def __init__(self, config: Union[ListConfig, DictConfig]):
-        config_relevant = config.planning
+    def __init__(self, config: SimpleNamespace):
+        config_relevant = vars(config.planning)
 
-        self.dt = config_relevant.dt
-        self.step_start = config_relevant.step_start
-        self.steps_computation = config_relevant.steps_computation
+        self.dt = config_relevant["dt"]
+        self.step_start = config_relevant["step_start"]
+        self.steps_computation = config_relevant["steps_computation"]
 
         self.p_lon_initial = None
         self.p_lat_initial = None
-        self.uncertainty_p_lon = config_relevant.uncertainty_p_lon
-        self.uncertainty_p_lat = config_relevant.uncertainty_p_lat
+        self.uncertainty_p_lon = config_relevant["uncertainty_p_lon"]
+        self.uncertainty_p_lat = config_relevant["uncertainty_p_lat"]
         self.v_lon_initial = None
         self.v_lat_initial = None
-        self.uncertainty_v_lon = config_relevant.uncertainty_v_lon
-        self.uncertainty_v_lat = config_relevant.uncertainty_v_lat
+        self.uncertainty_v_lon = config_relevant["uncertainty_v_lon"]
+        self.uncertainty_v_lat = config_relevant["uncertainty_v_lat"]
         self.o_initial = None
 
         # related to specific planning problem
@@ -445,8 +470,12 @@ class PlanningConfiguration(ConfigurationBase):
         self.lanelet_network = None
         self.list_ids_lanelets = None
         self.CLCS = None
-        self.coordinate_system = config_relevant.coordinate_system
-        self.reference_point = config_relevant.reference_point
+        # interned as these strings are frequently compared against literals
+        self.coordinate_system = sys.intern(config_relevant["coordinate_system"])
+        self.reference_point = sys.intern(config_relevant["reference_point"])
+
+        # planned route and its CLCS, reused by subsequent updates with the same scenario and planning problem
+        self._route_and_CLCS_planned = None
 
     @property
     def p_initial(self):
@@ -472,6 +501,37 @@ class PlanningConfiguration(ConfigurationBase):
         self.v_lon_initial = v_initial[0]
         self.v_lat_initial = v_initial[1]
 
+    def _plan_route_and_CLCS(self, scenario: Scenario, planning_problem: PlanningProblem) -> Tuple:
+        """
+        Returns the first planned route of the planning problem and the CLCS constructed from its reference path.
+
+        The result is reused as long as the lanelet network and the goal are the same objects and the initial state
+        has the same values, e.g., if the configuration is updated repeatedly with the same scenario.
+        """
+        lanelet_network = scenario.lanelet_network
+        goal = planning_problem.goal
+        state_initial = planning_problem.initial_state
+        key_state = (planning_problem.planning_problem_id, tuple(np.ravel(state_initial.position)),
+                     state_initial.orientation, state_initial.time_step)
+
+        planned = self._route_and_CLCS_planned
+        if planned is None or planned[0] is not lanelet_network or planned[1] is not goal or planned[2] != key_state:
+            from commonroad_route_planner.route_planner import RoutePlanner
+
+            # plans a route from the initial lanelet to the goal lanelet, set curvilinear coordinate system
+            route_planner = RoutePlanner(lanelet_network=lanelet_network, planning_problem=planning_problem)
+            candidate_holder = route_planner.plan_routes()
+            route = candidate_holder.retrieve_first_route()
+
+            CLCS = None
+            if route:
+                ref_path_mod = resample_polyline(route.reference_path, 0.5)
+                CLCS = util_configuration.create_curvilinear_coordinate_system(ref_path_mod)
+
+            planned = self._route_and_CLCS_planned = (lanelet_network, goal, key_state, route, CLCS)
+
+        return planned[3], planned[4]
+
     def update_configuration(self, config: Configuration):
         scenario = config.scenario
         planning_problem = config.planning_problem
@@ -481,7 +541,8 @@ class PlanningConfiguration(ConfigurationBase):
 
         self.step_start = planning_problem.initial_state.time_step
 
-        assert round(self.dt * 100) % round(scenario.dt * 100) == 0, \
+        ratio_dt = self.dt / scenario.dt
+        assert self.dt > 0 and round(ratio_dt) >= 1 and abs(ratio_dt - round(ratio_dt)) < 1e-9, \
             f"Value of dt ({self.dt}) should be a multiple of scenario dt ({scenario.dt})."
 
         if self.coordinate_system == "CART":
@@ -504,17 +565,10 @@ class PlanningConfiguration(ConfigurationBase):
                 self.reference_path = np.array(self.CLCS.reference_path())
 
             else:
-                # plans a route from the initial lanelet to the goal lanelet, set curvilinear coordinate system
-                route_planner = RoutePlanner(lanelet_network=scenario.lanelet_network,
-                                             planning_problem=planning_problem)
-                candidate_holder = route_planner.plan_routes()
-                route = candidate_holder.retrieve_first_route()
-
+                route, CLCS = self._plan_route_and_CLCS(scenario, planning_problem)
                 if route:
                     self.route = route
-                    ref_path_mod = resample_polyline(route.reference_path, 0.5)
-                    self.reference_path = ref_path_mod
-                    self.CLCS = util_configuration.create_curvilinear_coordinate_system(self.reference_path)
+                    self.CLCS = CLCS
                     self.reference_path = np.array(self.CLCS.reference_path())
 
             p_initial, v_initial = util_configuration.compute_initial_state_cvln(config)
@@ -532,29 +586,29 @@ class PlanningConfiguration(ConfigurationBase):
 
 
 class ReachableSetConfiguration(ConfigurationBase):
-    def __init__(self, config: Union[ListConfig, DictConfig]):
-        config_relevant = config.reachable_set
+    def __init__(self, config: SimpleNamespace):
+        config_relevant = vars(config.reachable_set)
 
-        self.mode_computation = config_relevant.mode_computation
-        self.mode_repartition = config_relevant.mode_repartition
-        self.mode_inflation = config_relevant.mode_inflation
-        self.consider_traffic = config_relevant.consider_traffic
-        self.rasterize_obstacles = config_relevant.rasterize_obstacles
-        self.rasterize_exclude_static = config_relevant.rasterize_exclude_static
+        self.mode_computation = config_relevant["mode_computation"]
+        self.mode_repartition = config_relevant["mode_repartition"]
+        self.mode_inflation = config_relevant["mode_inflation"]
+        self.consider_traffic = config_relevant["consider_traffic"]
+        self.rasterize_obstacles = config_relevant["rasterize_obstacles"]
+        self.rasterize_exclude_static = config_relevant["rasterize_exclude_static"]
 
-        self.size_grid = config_relevant.size_grid
-        self.size_grid_2nd = config_relevant.size_grid_2nd
-        self.radius_terminal_split = config_relevant.radius_terminal_split
-        self.prune_nodes_not_reaching_final_step = config_relevant.prune_nodes_not_reaching_final_step
-        self.exclude_small_components_corridor = config_relevant.exclude_small_components_corridor
+        self.size_grid = config_relevant["size_grid"]
+        self.size_grid_2nd = config_relevant["size_grid_2nd"]
+        self.radius_terminal_split = config_relevant["radius_terminal_split"]
+        self.prune_nodes_not_reaching_final_step = config_relevant["prune_nodes_not_reaching_final_step"]
+        self.exclude_small_components_corridor = config_relevant["exclude_small_components_corridor"]
 
-        self.name_pickle_offline = config_relevant.name_pickle_offline
-        self.n_multi_steps = config_relevant.n_multi_steps
+        self.name_pickle_offline = config_relevant["name_pickle_offline"]
+        self.n_multi_steps = config_relevant["n_multi_steps"]
 
-        self.num_threads = config_relevant.num_threads
+        self.num_threads = config_relevant["num_threads"]
 
         self.path_to_lut = os.path.abspath(
-            os.path.join(config.general.path_scenarios, "..", config_relevant.path_to_lut))
+            os.path.join(config.general.path_scenarios, "..", config_relevant["path_to_lut"]))
         self.lut_longitudinal_enlargement = None
 
     def update_configuration(self, config: Configuration):
@@ -564,18 +618,18 @@ class ReachableSetConfiguration(ConfigurationBase):
 
 
 class DebugConfiguration(ConfigurationBase):
-    def __init__(self, config: Union[ListConfig, DictConfig]):
-        config_relevant = config.debug
-
-        self.save_plots = config_relevant.save_plots
-        self.save_config = config_relevant.save_config
-        self.verbose_debug = config_relevant.verbose_debug
-        self.verbose_info = config_relevant.verbose_info
-        self.draw_ref_path = config_relevant.draw_ref_path
-        self.draw_planning_problem = config_relevant.draw_planning_problem
-        self.draw_icons = config_relevant.draw_icons
-        self.draw_lanelet_labels = config_relevant.draw_lanelet_labels
-        self.plot_limits = config_relevant.plot_limits
-        self.plot_azimuth = config_relevant.plot_azimuth
-        self.plot_elevation = config_relevant.plot_elevation
-        self.ax_distance = config_relevant.ax_distance
+    def __init__(self, config: SimpleNamespace):
+        config_relevant = vars(config.debug)
+
+        self.save_plots = config_relevant["save_plots"]
+        self.save_config = config_relevant["save_config"]
+        self.verbose_debug = config_relevant["verbose_debug"]
+        self.verbose_info = config_relevant["verbose_info"]
+        self.draw_ref_path = config_relevant["draw_ref_path"]
+        self.draw_planning_problem = config_relevant["draw_planning_problem"]
+        self.draw_icons = config_relevant["draw_icons"]
+        self.draw_lanelet_labels = config_relevant["draw_lanelet_labels"]
+        self.plot_limits = config_relevant["plot_limits"]
+        self.plot_azimuth = config_relevant["plot_azimuth"]
+        self.plot_elevation = config_relevant["plot_elevation"]
+        self.ax_distance = config_relevant["ax_distance"]
@@ -2,7 +2,6 @@ import logging
 from typing import Union, List, Dict
 
 import numpy as np
-import networkx as nx
 from commonroad.geometry.shape import Shape, ShapeGroup
 
 from commonroad_reach import pycrreach
@@ -20,14 +19,33 @@ class DrivingCorridorExtractor:
     """
     Class to extract driving corridors from reachable sets and drivable areas.
     """
+    __slots__ = ("config", "backend", "_reachable_sets", "_dict_node_to_nodes_parent", "_dict_nodes_to_list_cc",
+                 "_step_initial")
 
     def __init__(self, reachable_sets: Dict[int, List[Union[pycrreach.ReachNode, ReachNode]]], config: Configuration):
+        # parent nodes of reach nodes, retrieved once per reach node
+        self._dict_node_to_nodes_parent = dict()
+        # connected components of sets of reach nodes, reused across extractions on the same reachable sets
+        self._dict_nodes_to_list_cc = dict()
         self.reachable_sets = reachable_sets
         self.config = config
         self.backend = "CPP" if config.reachable_set.mode_computation == 2 else "PYTHON"
+        # initial step of the reachable sets, set before each extraction
+        self._step_initial = None
 
         util_logger.print_and_log_debug(logger, "Driving corridor extractor initialized.")
 
+    @property
+    def reachable_sets(self) -> Dict[int, List[Union[pycrreach.ReachNode, ReachNode]]]:
+        return self._reachable_sets
+
+    @reachable_sets.setter
+    def reachable_sets(self, reachable_sets: Dict[int, List[Union[pycrreach.ReachNode, ReachNode]]]):
+        # cached parents and connected components refer to the nodes of the previous reachable sets
+        self._reachable_sets = reachable_sets
+        self._dict_node_to_nodes_parent.clear()
+        self._dict_nodes_to_list_cc.clear()
+
     @property
     def steps(self):
         return sorted(list(self.reachable_sets.keys()))
@@ -166,21 +184,20 @@ class DrivingCorridorExtractor:
         else:
             dict_step_to_p_lon = dict()
 
-        list_cc_terminal = util_reach_operation.determine_connected_components(list_nodes_terminal)
+        # steps are sorted upon each access, thus the initial step is retrieved once for the backward traversal
+        self._step_initial = self.steps[0]
+        list_cc_terminal = self._determine_connected_components(list_nodes_terminal, False)
         for cc_terminal in list_cc_terminal:
-            list_lists_ids_cc = list()
+            list_lists_cc = list()
 
-            # create a graph of connected components backward in time
-            graph_cc = nx.DiGraph()
-            graph_cc.add_node(cc_terminal.id, connected_component=cc_terminal)
-            self._create_connected_component_graph(list_lists_ids_cc, graph_cc, cc_terminal,
-                                                   corridor_lon, dict_step_to_p_lon, cc_terminal.id)
+            # traverse connected components backward in time
+            self._extract_sequences_of_connected_components(list_lists_cc, [cc_terminal],
+                                                            corridor_lon, dict_step_to_p_lon)
 
             # convert each sequence of connected components to a driving corridor
-            for lists_ids_cc in list_lists_ids_cc:
+            for list_cc in list_lists_cc:
                 corridor = DrivingCorridor()
-                for id_cc in lists_ids_cc:
-                    cc = graph_cc.nodes[id_cc]["connected_component"]
+                for cc in list_cc:
                     corridor.add_connected_component(cc)
 
                 list_corridors.append(corridor)
@@ -188,8 +205,7 @@ class DrivingCorridorExtractor:
         if not list_corridors:
             util_logger.print_and_log_warning(logger, "\tNo driving corridor extracted!")
 
-        list_corridors.sort(key=lambda dc: dc.area, reverse=True)
-
+        # corridors are sorted by their area once all terminal shapes are processed, see extract()
         return list_corridors
 
     def _determine_overlapping_nodes_longitudinal(self, list_nodes_reach, shape_terminal: Shape,
@@ -232,78 +248,119 @@ class DrivingCorridorExtractor:
 
         return list_nodes_terminal
 
-    def _create_connected_component_graph(self, list_lists_ids_cc: List[int], graph_cc: nx.Graph,
-                                          cc_current: ConnectedComponent, corridor_lon: DrivingCorridor = None,
-                                          dict_step_to_p_lon: Dict[int, float] = None, id_cc_terminal: int = 0):
+    def _extract_sequences_of_connected_components(self, list_lists_cc: List[List[ConnectedComponent]],
+                                                   list_cc_path: List[ConnectedComponent],
+                                                   corridor_lon: DrivingCorridor = None,
+                                                   dict_step_to_p_lon: Dict[int, float] = None):
         """
-        Traverses graph of connected reachable sets backwards in time and extracts paths starting from a terminal set.
+        Traverses connected reachable sets backwards in time and extracts paths starting from a terminal set.
 
-        A path within the graph corresponds to a possible driving corridor.
+        The traversed connected components form a tree rooted at the terminal set, thus the path from the terminal set
+        to the currently examined connected component is unique and kept as a stack. A path reaching the initial step
+        corresponds to a possible driving corridor.
 
-        :param list_lists_ids_cc: list of found driving corridors in the reachable set
-        :param graph_cc: graph of possible driving corridors
-        :param cc_current: currently examined connected component
+        :param list_lists_cc: list of found driving corridors in the reachable set, each given as a list of connected
+            components ordered from the initial to the terminal step
+        :param list_cc_path: connected components from the terminal set to the currently examined connected component
         :param corridor_lon: longitudinal driving corridor (only necessary for lateral DCs)
         :param dict_step_to_p_lon: dictionary mapping step to longitudinal positions (only necessary for lateral DCs)
-        :param id_cc_terminal: id of the terminal connected component
         """
-        # todo: make as a config parameter?
-        # terminate if enough driving corridors are found
-        if len(list_lists_ids_cc) > 10:
+        if self._found_enough_driving_corridors(list_lists_cc):
             return
 
-        # computation reached the initial step, extract simple paths from terminal cc to initial cc
-        if cc_current.step == self.steps[0]:
-            # source: id of initial cc, target: id of terminal cc
-            list_lists_ids_cc.extend(nx.all_simple_paths(graph_cc, cc_current.id, id_cc_terminal))
+        cc_current = list_cc_path[-1]
+        # computation reached the initial step, store path from initial cc to terminal cc
+        if cc_current.step == self._step_initial:
+            list_lists_cc.append(list_cc_path[::-1])
             return
 
         # determine parent reach nodes for each reach node within the current connected component
-        set_nodes_reach_parent = set()
-        [set_nodes_reach_parent.update(reach_node.list_nodes_parent) for reach_node in cc_current.list_nodes_reach]
+        # the keys of a dictionary keep the order of insertion, thus the order of parent nodes is reproducible
+        dict_nodes_reach_parent = dict()
+        for reach_node in cc_current.list_nodes_reach:
+            dict_nodes_reach_parent.update(dict.fromkeys(self._nodes_parent(reach_node)))
 
         list_nodes_parent_filtered = list()
         if not corridor_lon and not dict_step_to_p_lon:
             # extract longitudinal DC
-            list_nodes_parent_filtered = list(set_nodes_reach_parent)
+            list_nodes_parent_filtered = list(dict_nodes_reach_parent)
 
         elif corridor_lon and dict_step_to_p_lon:
             # extract lateral DC
             # consider only reach nodes that overlap with given longitudinal position
             step_parent = cc_current.step - 1
             list_nodes_parent_filtered = util_reach_operation.determine_overlapping_nodes_with_lon_pos(
-                list(set_nodes_reach_parent), dict_step_to_p_lon[step_parent])
+                list(dict_nodes_reach_parent), dict_step_to_p_lon[step_parent])
 
             # todo: update this message?
             if not list_nodes_parent_filtered:
                 util_logger.print_and_log_warning(logger,
                                                   f'No reachboxes found at x position. #parent reach nodes: '
-                                                  f'{len(set_nodes_reach_parent)}. current step {cc_current.step}')
+                                                  f'{len(dict_nodes_reach_parent)}. current step {cc_current.step}')
 
             # filter out reach nodes that are not part of the longitudinal driving corridor
-            set_nodes_reach_parent = set(list_nodes_parent_filtered)
-            set_nodes_reach_parent.intersection_update(corridor_lon.reach_nodes_at_step(step_parent))
-            list_nodes_parent_filtered = list(set_nodes_reach_parent)
+            set_nodes_corridor_lon = set(corridor_lon.reach_nodes_at_step(step_parent))
+            list_nodes_parent_filtered = [node for node in list_nodes_parent_filtered
+                                          if node in set_nodes_corridor_lon]
 
         # determine connected components in parent reach nodes
         exclude_small_area = self.config.reachable_set.exclude_small_components_corridor and \
-                             cc_current.step - self.steps[0] > 5
-        cc_parent = util_reach_operation.determine_connected_components(list_nodes_parent_filtered, exclude_small_area)
+                             cc_current.step - self._step_initial > 5
+        cc_parent = self._determine_connected_components(list_nodes_parent_filtered, exclude_small_area)
 
-        # recursion backwards in time
+        # recursion backwards in time, remaining connected components are skipped once enough corridors are found
         for cc_next in cc_parent:
-            graph_cc.add_node(cc_next.id, connected_component=cc_next)
-            graph_cc.add_edge(cc_next.id, cc_current.id)
-            self._create_connected_component_graph(list_lists_ids_cc, graph_cc, cc_next,
-                                                   corridor_lon, dict_step_to_p_lon, id_cc_terminal)
+            if self._found_enough_driving_corridors(list_lists_cc):
+                return
+
+            list_cc_path.append(cc_next)
+            self._extract_sequences_of_connected_components(list_lists_cc, list_cc_path,
+                                                            corridor_lon, dict_step_to_p_lon)
+            list_cc_path.pop()
+
+    @staticmethod
+    def _found_enough_driving_corridors(list_lists_cc: List[List[ConnectedComponent]]) -> bool:
+        # todo: make as a config parameter?
+        # terminate if enough driving corridors are found
+        return len(list_lists_cc) > 10
+
+    def _determine_connected_components(self, list_nodes_reach: List[Union[pycrreach.ReachNode, ReachNode]],
+                                        exclude_small_area: bool) -> List[ConnectedComponent]:
+        """
+        Returns the connected components of the given reach nodes.
+
+        Different branches of the backward traversal may arrive at the same set of parent reach nodes, for which the
+        previously determined connected components are reused, also by subsequent extractions, e.g., of lateral
+        driving corridors after longitudinal ones. Connected components are not modified after their
+        creation, thus they can be shared among driving corridors.
+        """
+        key = (frozenset(list_nodes_reach), exclude_small_area)
+        list_cc = self._dict_nodes_to_list_cc.get(key)
+        if list_cc is None:
+            list_cc = self._dict_nodes_to_list_cc[key] = \
+                util_reach_operation.determine_connected_components(list_nodes_reach, exclude_small_area)
+
+        return list_cc
+
+    def _nodes_parent(self, node_reach: Union[pycrreach.ReachNode, ReachNode]) \
+            -> List[Union[pycrreach.ReachNode, ReachNode]]:
+        """
+        Returns the parent nodes of the given reach node.
+
+        Reach nodes are visited repeatedly during the backward traversal. For the C++ backend, every access to the
+        parent nodes converts them into a new list, thus the parent nodes are retrieved once and stored.
+        """
+        list_nodes_parent = self._dict_node_to_nodes_parent.get(node_reach)
+        if list_nodes_parent is None:
+            list_nodes_parent = self._dict_node_to_nodes_parent[node_reach] = node_reach.list_nodes_parent
+
+        return list_nodes_parent
 
     @staticmethod
     def _determine_area_of_driving_corridor(driving_corridor: Dict[int, List[Union[pycrreach.ReachNode, ReachNode]]]):
         """
         Function to compute the cumulative area of a driving corridor.
         """
-        area = 0.0
-        for time_idx, reach_set_nodes in driving_corridor.items():
-            area += util_reach_operation.compute_area_of_reach_nodes(reach_set_nodes)
-
-        return area
+        # nodes of all steps are gathered to compute the area at once
+        return util_reach_operation.compute_area_of_reach_nodes(
+            [node for reach_set_nodes in driving_corridor.values() for node in reach_set_nodes])
@@ -142,21 +142,23 @@ class PyReachableSet(ReachableSet):
         """
         Propagates nodes of the reachable set.
         """
+        dt = self.config.planning.dt
+        v_lon_min = self.config.vehicle.ego.v_lon_min
+        v_lon_max = self.config.vehicle.ego.v_lon_max
+        v_lat_min = self.config.vehicle.ego.v_lat_min
+        v_lat_max = self.config.vehicle.ego.v_lat_max
+
         list_base_sets_propagated = []
         for node in list_nodes:
             try:
                 # propagate in both directions
                 polygon_lon_propagated = reach_operation.propagate_polygon(node.polygon_lon,
                                                                            self.polygon_zero_state_lon,
-                                                                           self.config.planning.dt,
-                                                                           self.config.vehicle.ego.v_lon_min,
-                                                                           self.config.vehicle.ego.v_lon_max)
+                                                                           dt, v_lon_min, v_lon_max)
 
                 polygon_lat_propagated = reach_operation.propagate_polygon(node.polygon_lat,
                                                                            self.polygon_zero_state_lat,
-                                                                           self.config.planning.dt,
-                                                                           self.config.vehicle.ego.v_lat_min,
-                                                                           self.config.vehicle.ego.v_lat_max)
+                                                                           dt, v_lat_min, v_lat_max)
             except (ValueError, RuntimeError, AttributeError):
                 util_logger.print_and_log_debug(logger, "Error occurred while propagating polygons.")
 
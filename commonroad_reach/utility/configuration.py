@@ -1,15 +1,16 @@
 import os
+from functools import lru_cache
 from typing import Tuple, Dict
 from collections import defaultdict
 
 import commonroad_dc.pycrccosy as pycrccosy
 from commonroad.scenario.trajectory import State
-from commonroad_dc.geometry.util import compute_orientation_from_polyline, compute_pathlength_from_polyline
 import numpy as np
 
 np.seterr(divide='ignore', invalid='ignore')
 
 
+@lru_cache(128)
 def compute_disc_radius_and_distance(length: float, width: float, ref_point="CENTER", dist_axle_rear=None) \
         -> Tuple[float, float]:
     """
@@ -71,6 +72,7 @@ def compute_disc_radius_and_distance(length: float, width: float, ref_point="CEN
     return radius_disc, dist_circles
 
 
+@lru_cache(128)
 def compute_disc_radius_and_wheelbase(length: float, width: float, wheelbase: float = None) -> Tuple[float, float]:
     """
     Computes the radius of the discs to approximate the shape of vehicle.
@@ -101,6 +103,7 @@ def compute_disc_radius_and_wheelbase(length: float, width: float, wheelbase: fl
     return radius_disc, wheelbase
 
 
+@lru_cache(128)
 def compute_inflation_radius(mode_inflation: int, length: float, width: float, radius_disc: float) -> float:
     """
     Computes the radius to inflate the obstacles for collision check of the ego vehicle.
@@ -128,7 +131,11 @@ def create_curvilinear_coordinate_system(reference_path: np.ndarray, limit_proje
                                          eps: float = 0.1, eps2: float = 1e-4) -> pycrccosy.CurvilinearCoordinateSystem:
     """
     Creates a curvilinear coordinate system from the given reference path.
+
+    The reference path is handed to the binding as a C-contiguous float64 array, which the binding reads directly
+    without an intermediate dtype or layout conversion.
     """
+    reference_path = np.ascontiguousarray(reference_path, dtype=np.float64)
     CLCS = pycrccosy.CurvilinearCoordinateSystem(reference_path, limit_projection_domain, eps, eps2)
     CLCS.compute_and_set_curvature()
 
@@ -191,9 +198,13 @@ def compute_initial_state_cvln(config) -> Tuple:
     else:
         raise Exception(f"Unknown reference point: {config.planning.reference_point}")
 
-    reference_path = config.planning.reference_path
-    ref_orientation = compute_orientation_from_polyline(reference_path)
-    ref_path_length = compute_pathlength_from_polyline(reference_path)
+    # orientation of each segment of the reference path (the last vertex takes the orientation of the last segment)
+    # and path length at each vertex, both computed in a vectorized manner
+    diff_reference_path = np.diff(np.asarray(config.planning.reference_path, dtype=np.float64), axis=0)
+    ref_orientation = np.arctan2(diff_reference_path[:, 1], diff_reference_path[:, 0])
+    ref_orientation = np.append(ref_orientation, ref_orientation[-1])
+    ref_path_length = np.concatenate(([0.0], np.cumsum(np.hypot(diff_reference_path[:, 0],
+                                                                 diff_reference_path[:, 1]))))
     orientation_interpolated = np.interp(p_lon, ref_path_length, ref_orientation)
 
     v_lon = v * np.cos(orientation - orientation_interpolated)
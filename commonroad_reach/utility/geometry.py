@@ -5,20 +5,17 @@ import numpy as np
 import commonroad_dc.pycrcc as pycrcc
 
 from commonroad_reach.data_structure.reach.reach_polygon import ReachPolygon
-from commonroad_reach.data_structure.reach.reach_vertex import Vertex
 
 
 def linear_mapping(polygon: ReachPolygon, tuple_coefficients: Tuple[float, float, float, float]) -> ReachPolygon:
     """
     Returns the linear mapping of the input polygon.
     """
-    list_vertices = polygon.vertices
     a11, a12, a21, a22 = tuple_coefficients
+    # vertices are mapped at once as (x, y) @ A^T
+    array_vertices_mapped = np.asarray(polygon.vertices, dtype=np.float64) @ np.array([[a11, a21], [a12, a22]])
 
-    list_vertices_mapped = [(a11 * vertex[0] + a12 * vertex[1],
-                             a21 * vertex[0] + a22 * vertex[1]) for vertex in list_vertices]
-
-    return ReachPolygon(list_vertices_mapped)
+    return ReachPolygon(array_vertices_mapped.tolist())
 
 
 def minkowski_sum(polygon1: ReachPolygon, polygon2: ReachPolygon) -> Optional[ReachPolygon]:
@@ -28,16 +25,11 @@ def minkowski_sum(polygon1: ReachPolygon, polygon2: ReachPolygon) -> Optional[Re
     if polygon1.is_empty or polygon2.is_empty:
         return None
 
-    list_vertices_sum = list()
-    list_vertices_1 = sort_vertices_counterclockwise(polygon1.vertices)
-    list_vertices_2 = sort_vertices_counterclockwise(polygon2.vertices)
-
-    for vertex_1 in list_vertices_1:
-        for vertex_2 in list_vertices_2:
-            list_vertices_sum.append(Vertex(vertex_1[0] + vertex_2[0], vertex_1[1] + vertex_2[1]))
-
-    list_vertices_sum = list(set(list_vertices_sum))
-    list_vertices_sum = [(vertex.x, vertex.y) for vertex in list_vertices_sum]
+    # sums of all pairs of vertices, the convex hull of which is the Minkowski sum of the (convex) polygons
+    array_vertices_1 = np.asarray(polygon1.vertices, dtype=np.float64)
+    array_vertices_2 = np.asarray(polygon2.vertices, dtype=np.float64)
+    array_vertices_sum = (array_vertices_1[:, None, :] + array_vertices_2[None, :, :]).reshape(-1, 2)
+    list_vertices_sum = np.unique(array_vertices_sum, axis=0).tolist()
 
     return ReachPolygon.from_polygon(ReachPolygon(list_vertices_sum).shapely_object.convex_hull)
 
@@ -4,7 +4,9 @@ from decimal import Decimal
 from typing import Union
 
 import numpy as np
-import networkx as nx
+import shapely
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
 
 logger = logging.getLogger(__name__)
 from math import ceil, floor
@@ -18,6 +20,12 @@ from commonroad_reach.utility import geometry as util_geometry
 from commonroad_reach.utility.sweep_line import SweepLine
 from commonroad_reach import pycrreach
 
+# up to this number of nodes, overlaps are determined by testing all pairs of nodes
+NUM_NODES_PAIRWISE_OVERLAP_MAX = 256
+# positions are enlarged to this number of decimal digits when determining overlaps of reach nodes
+NUM_DIGITS_OVERLAP = 2
+_COEFFICIENT_OVERLAP = 10.0 ** NUM_DIGITS_OVERLAP
+
 
 def create_zero_state_polygon(dt: float, a_min: float, a_max: float) -> ReachPolygon:
     """
@@ -485,13 +493,14 @@ def compute_area_of_reach_nodes(list_nodes_reach: List[ReachNode]) -> float:
     """
     Computes the area of a given list of reach nodes.
     """
-    area = 0.0
     if not list_nodes_reach:
-        return area
+        return 0.0
+
+    # bounds of position rectangles, columns: p_lon_min, p_lat_min, p_lon_max, p_lat_max
+    array_bounds = np.array([(node.p_lon_min, node.p_lat_min, node.p_lon_max, node.p_lat_max)
+                             for node in list_nodes_reach], dtype=np.float64)
 
-    for node in list_nodes_reach:
-        area += (node.p_lon_max - node.p_lon_min) * (node.p_lat_max - node.p_lat_min)
-    return area
+    return float(np.dot(array_bounds[:, 2] - array_bounds[:, 0], array_bounds[:, 3] - array_bounds[:, 1]))
 
 
 def connected_reachset_py(list_nodes_reach: List[ReachNode], num_digits: int):
@@ -501,27 +510,38 @@ def connected_reachset_py(list_nodes_reach: List[ReachNode], num_digits: int):
     Returns a dictionary in the form of {node index:list of tuples (node index, node index)}.
     This function is the equivalent python function to pycrreach.connected_reachset_boost().
     """
-    coefficient = np.power(10.0, num_digits)
+    coefficient = 10.0 ** num_digits
     dict_adjacency = defaultdict(list)
-    list_position_rectangles = list()
-    # preprocess
-    for node_reach in list_nodes_reach:
-        # enlarge position rectangles
-        vertices_rectangle_scaled = (np.floor(node_reach.p_lon_min * coefficient),
-                                     np.floor(node_reach.p_lat_min * coefficient),
-                                     np.ceil(node_reach.p_lon_max * coefficient),
-                                     np.ceil(node_reach.p_lat_max * coefficient))
-        list_position_rectangles.append(ReachPolygon.from_rectangle_vertices(*vertices_rectangle_scaled))
-
-    # iterate over all rectangles
-    for idx1, position_rect_1 in enumerate(list_position_rectangles):
-        for idx2, position_rect_2 in enumerate(list_position_rectangles):
-            if idx1 == idx2:
-                continue
-
-            # check for dict_adjacency via shapely intersects() function. If True, add tuple of idx to dict
-            if position_rect_1.intersects(position_rect_2):
-                dict_adjacency[idx1].append((idx1, idx2))
+    if not list_nodes_reach:
+        return dict_adjacency
+
+    # bounds of position rectangles, columns: p_lon_min, p_lat_min, p_lon_max, p_lat_max
+    array_bounds = np.array([(node_reach.p_lon_min, node_reach.p_lat_min, node_reach.p_lon_max, node_reach.p_lat_max)
+                             for node_reach in list_nodes_reach], dtype=np.float64) * coefficient
+    # enlarge position rectangles
+    p_lon_min, p_lat_min = np.floor(array_bounds[:, 0]), np.floor(array_bounds[:, 1])
+    p_lon_max, p_lat_max = np.ceil(array_bounds[:, 2]), np.ceil(array_bounds[:, 3])
+
+    # touching rectangles are considered to be intersecting
+    if len(list_nodes_reach) <= NUM_NODES_PAIRWISE_OVERLAP_MAX:
+        # pairwise intersection test of all rectangles
+        mask_intersecting = \
+            (p_lon_min[:, None] <= p_lon_max[None, :]) & (p_lon_max[:, None] >= p_lon_min[None, :]) & \
+            (p_lat_min[:, None] <= p_lat_max[None, :]) & (p_lat_max[:, None] >= p_lat_min[None, :])
+        np.fill_diagonal(mask_intersecting, False)
+        array_idx1, array_idx2 = np.nonzero(mask_intersecting)
+
+    else:
+        # query candidates from a spatial index instead of testing all pairs
+        array_boxes = shapely.box(p_lon_min, p_lat_min, p_lon_max, p_lat_max)
+        array_idx1, array_idx2 = shapely.STRtree(array_boxes).query(array_boxes, predicate="intersects")
+        mask_pairs = array_idx1 != array_idx2
+        array_idx1, array_idx2 = array_idx1[mask_pairs], array_idx2[mask_pairs]
+        order = np.lexsort((array_idx2, array_idx1))
+        array_idx1, array_idx2 = array_idx1[order], array_idx2[order]
+
+    for idx1, idx2 in zip(array_idx1.tolist(), array_idx2.tolist()):
+        dict_adjacency[idx1].append((idx1, idx2))
 
     return dict_adjacency
 
@@ -575,14 +595,45 @@ def determine_overlapping_nodes_with_lon_pos(list_nodes_reach: List[Union[pycrre
     Projects reachset nodes onto longitudinal position domain and determines reachset nodes which contain a given
     longitudinal position
     """
-    set_nodes_overlap = set()
+    if not list_nodes_reach:
+        return list()
+
+    p_lon_scaled = round(p_lon * _COEFFICIENT_OVERLAP)
+    # longitudinal bounds of nodes, columns: p_lon_min, p_lon_max
+    array_bounds_lon = np.array([(node_reach.p_lon_min, node_reach.p_lon_max) for node_reach in list_nodes_reach],
+                                dtype=np.float64) * _COEFFICIENT_OVERLAP
+    mask_overlap = (np.floor(array_bounds_lon[:, 0]) <= p_lon_scaled) & \
+                   (np.ceil(array_bounds_lon[:, 1]) >= p_lon_scaled)
 
-    for node_reach in list_nodes_reach:
-        if np.greater_equal(round(p_lon * 10.0 ** 2), np.floor(node_reach.p_lon_min * 10.0 ** 2)) and \
-                np.greater_equal(np.ceil(node_reach.p_lon_max * 10.0 ** 2), round(p_lon * 10.0 ** 2)):
-            set_nodes_overlap.add(node_reach)
+    # duplicate nodes are removed
+    return list(dict.fromkeys(list_nodes_reach[idx] for idx in np.flatnonzero(mask_overlap).tolist()))
 
-    return list(set_nodes_overlap)
+
+def _determine_connected_indices(num_nodes: int, overlap: dict) -> List[List[int]]:
+    """
+    Groups the indices of nodes into connected components.
+
+    The components are labeled by the compiled graph routine of scipy, which operates on arrays of node indices.
+
+    :param num_nodes: number of nodes
+    :param overlap: dictionary in the form of {node index: list of tuples (node index, node index)}
+    :return: list of connected components, each given as a list of node indices
+    """
+    # without overlaps, each node forms a connected component on its own
+    if not any(overlap.values()):
+        return [[idx] for idx in range(num_nodes)]
+
+    array_pairs = np.array([pair for list_pairs in overlap.values() for pair in list_pairs],
+                           dtype=np.int64).reshape(-1, 2)
+    matrix_adjacency = sparse.coo_matrix((np.ones(len(array_pairs), dtype=np.int8),
+                                          (array_pairs[:, 0], array_pairs[:, 1])), shape=(num_nodes, num_nodes))
+    _, array_labels = connected_components(matrix_adjacency, directed=False)
+
+    dict_label_to_indices = defaultdict(list)
+    for idx, label in enumerate(array_labels.tolist()):
+        dict_label_to_indices[label].append(idx)
+
+    return list(dict_label_to_indices.values())
 
 
 def determine_connected_components(list_nodes_reach, exclude_small_area: bool = False):
@@ -599,30 +650,18 @@ def determine_connected_components(list_nodes_reach, exclude_small_area: bool =
     """
     from commonroad_reach.data_structure.reach.driving_corridor import ConnectedComponent
 
-    num_digits = 2
-
     if type(list_nodes_reach[0]) == pycrreach.ReachNode:
-        overlap = pycrreach.connected_reachset_boost(list_nodes_reach, num_digits)
+        overlap = pycrreach.connected_reachset_boost(list_nodes_reach, NUM_DIGITS_OVERLAP)
     else:
-        overlap = connected_reachset_py(list_nodes_reach, num_digits)
-
-    # adjacency list: list with tuples, e.g., (0, 1) representing that node 0 and node 1 are connected
-    adjacency = []
-    for v in overlap.values():
-        adjacency += v
+        overlap = connected_reachset_py(list_nodes_reach, NUM_DIGITS_OVERLAP)
 
     list_connected_component = list()
-    # create graph with nodes = reach nodes and edges = adjacency status
-    graph = nx.Graph()
-    graph.add_nodes_from(list(range(len(list_nodes_reach))))
-    graph.add_edges_from(adjacency)
-
-    for set_indices_nodes_reach_connected in nx.connected_components(graph):
-        list_nodes_reach_in_cc = [list_nodes_reach[idx] for idx in set_indices_nodes_reach_connected]
+    for list_indices_nodes_reach_connected in _determine_connected_indices(len(list_nodes_reach), overlap):
+        list_nodes_reach_in_cc = [list_nodes_reach[idx] for idx in list_indices_nodes_reach_connected]
         connected_component = ConnectedComponent(list_nodes_reach_in_cc)
 
         # todo: add threshold to config?
-        if exclude_small_area and len(set_indices_nodes_reach_connected) >= 2 and connected_component.area < 0.05:
+        if exclude_small_area and len(list_indices_nodes_reach_connected) >= 2 and connected_component.area < 0.05:
             continue
 
         list_connected_component.append(connected_component)
@@ -1,3 +1,4 @@
+import argparse
 from typing import Optional
 import commonroad_reach.utility.logger as util_logger
 from commonroad_reach.data_structure.configuration_builder import ConfigurationBuilder
@@ -5,7 +6,7 @@ from commonroad_reach.data_structure.reach.reach_interface import ReachableSetIn
 from commonroad_reach.utility import visualization as util_visual
 
 
-def main():
+def main(plot: bool = True):
     # ==== specify scenario
     name_scenario = "DEU_Test-1_1_T-1"
     # name_scenario = "ZAM_Over-1_1"
@@ -27,8 +28,13 @@ def main():
     reach_interface.compute_reachable_sets()
 
     # ==== plot computation results
-    util_visual.plot_scenario_with_reachable_sets(reach_interface)
+    if plot:
+        util_visual.plot_scenario_with_reachable_sets(reach_interface)
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Computes reachable sets of the specified scenario.")
+    parser.add_argument("--no-plot", action="store_true", help="skip plotting, e.g., for smoke tests")
+    args = parser.parse_args()
+
+    main(plot=not args.no_plot)
@@ -76,6 +76,74 @@ void export_reach_node(py::module &m) {
             });
 }
 
+namespace {
+template<typename T>
+void read_vehicle_from_dict(py::dict const& dict_vehicle, T& vehicle) {
+    vehicle.id_type_vehicle = dict_vehicle["id_type_vehicle"].cast<int>();
+    vehicle.length = dict_vehicle["length"].cast<double>();
+    vehicle.width = dict_vehicle["width"].cast<double>();
+    vehicle.radius_disc = dict_vehicle["radius_disc"].cast<double>();
+    vehicle.circle_distance = dict_vehicle["circle_distance"].cast<double>();
+    vehicle.wheelbase = dict_vehicle["wheelbase"].cast<double>();
+    vehicle.v_lon_min = dict_vehicle["v_lon_min"].cast<double>();
+    vehicle.v_lon_max = dict_vehicle["v_lon_max"].cast<double>();
+    vehicle.v_lat_min = dict_vehicle["v_lat_min"].cast<double>();
+    vehicle.v_lat_max = dict_vehicle["v_lat_max"].cast<double>();
+    vehicle.a_lon_min = dict_vehicle["a_lon_min"].cast<double>();
+    vehicle.a_lon_max = dict_vehicle["a_lon_max"].cast<double>();
+    vehicle.a_lat_min = dict_vehicle["a_lat_min"].cast<double>();
+    vehicle.a_lat_max = dict_vehicle["a_lat_max"].cast<double>();
+    vehicle.a_max = dict_vehicle["a_max"].cast<double>();
+}
+
+/// Creates a configuration from a nested dictionary in a single call, avoiding per-attribute assignments from Python.
+ConfigurationPtr configuration_from_dict(py::dict const& dict_config) {
+    auto config = std::make_shared<Configuration>();
+
+    auto dict_general = dict_config["general"].cast<py::dict>();
+    config->config_general.name_scenario = dict_general["name_scenario"].cast<string>();
+    config->config_general.path_scenarios = dict_general["path_scenarios"].cast<string>();
+
+    auto dict_vehicle = dict_config["vehicle"].cast<py::dict>();
+    read_vehicle_from_dict(dict_vehicle["ego"].cast<py::dict>(), config->config_vehicle.ego);
+    read_vehicle_from_dict(dict_vehicle["other"].cast<py::dict>(), config->config_vehicle.other);
+
+    auto dict_planning = dict_config["planning"].cast<py::dict>();
+    auto& planning = config->config_planning;
+    planning.dt = dict_planning["dt"].cast<double>();
+    planning.step_start = dict_planning["step_start"].cast<int>();
+    planning.steps_computation = dict_planning["steps_computation"].cast<int>();
+    planning.p_lon_initial = dict_planning["p_lon_initial"].cast<double>();
+    planning.p_lat_initial = dict_planning["p_lat_initial"].cast<double>();
+    planning.uncertainty_p_lon = dict_planning["uncertainty_p_lon"].cast<double>();
+    planning.uncertainty_p_lat = dict_planning["uncertainty_p_lat"].cast<double>();
+    planning.v_lon_initial = dict_planning["v_lon_initial"].cast<double>();
+    planning.v_lat_initial = dict_planning["v_lat_initial"].cast<double>();
+    planning.uncertainty_v_lon = dict_planning["uncertainty_v_lon"].cast<double>();
+    planning.uncertainty_v_lat = dict_planning["uncertainty_v_lat"].cast<double>();
+    planning.coordinate_system = dict_planning["coordinate_system"].cast<CoordinateSystem>();
+    planning.reference_point = dict_planning["reference_point"].cast<ReferencePoint>();
+    if (dict_planning.contains("CLCS") && !dict_planning["CLCS"].is_none())
+        planning.CLCS = dict_planning["CLCS"].cast<std::shared_ptr<geometry::CurvilinearCoordinateSystem>>();
+
+    auto dict_reachable_set = dict_config["reachable_set"].cast<py::dict>();
+    auto& reachable_set = config->config_reachable_set;
+    reachable_set.mode_repartition = dict_reachable_set["mode_repartition"].cast<int>();
+    reachable_set.mode_inflation = dict_reachable_set["mode_inflation"].cast<int>();
+    reachable_set.size_grid = dict_reachable_set["size_grid"].cast<double>();
+    reachable_set.size_grid_2nd = dict_reachable_set["size_grid_2nd"].cast<double>();
+    reachable_set.radius_terminal_split = dict_reachable_set["radius_terminal_split"].cast<double>();
+    reachable_set.num_threads = dict_reachable_set["num_threads"].cast<int>();
+    reachable_set.prune_nodes = dict_reachable_set["prune_nodes"].cast<bool>();
+    reachable_set.rasterize_obstacles = dict_reachable_set["rasterize_obstacles"].cast<bool>();
+    if (dict_reachable_set.contains("lut_lon_enlargement") && !dict_reachable_set["lut_lon_enlargement"].is_none())
+        reachable_set.lut_lon_enlargement =
+                dict_reachable_set["lut_lon_enlargement"].cast<std::shared_ptr<LUTLongitudinalEnlargement>>();
+
+    return config;
+}
+}
+
 void export_configuration(py::module &m) {
     py::enum_<CoordinateSystem>(m, "CoordinateSystem")
             .value("CARTESIAN", CoordinateSystem::CARTESIAN)
@@ -89,6 +157,7 @@ void export_configuration(py::module &m) {
 
     py::class_<Configuration, shared_ptr<Configuration>>(m, "Configuration")
             .def(py::init<>())
+            .def_static("from_dict", &configuration_from_dict, py::arg("dict_config"))
             .def_readwrite("general", &Configuration::config_general)
             .def_readwrite("vehicle", &Configuration::config_vehicle)
             .def_readwrite("planning", &Configuration::config_planning)
@@ -159,7 +228,6 @@ void export_configuration(py::module &m) {
             .def_readwrite("v_lat_initial", &PlanningConfiguration::v_lat_initial)
             .def_readwrite("uncertainty_v_lon", &PlanningConfiguration::uncertainty_v_lon)
             .def_readwrite("uncertainty_v_lat", &PlanningConfiguration::uncertainty_v_lat)
-            .def_readwrite("step_start", &PlanningConfiguration::step_start)
             .def_readwrite("id_lanelet_initial", &PlanningConfiguration::id_lanelet_initial)
             .def_readwrite("coordinate_system", &PlanningConfiguration::coordinate_system)
             .def_readwrite("reference_point", &PlanningConfiguration::reference_point)
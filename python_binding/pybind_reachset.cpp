@@ -18,12 +18,15 @@ void export_reachable_set(py::module& m) {
             .def_readonly("collision_checker", &ReachableSet::collision_checker)
             .def_readonly("step_start", &ReachableSet::step_start)
             .def_readonly("step_end", &ReachableSet::step_end)
-            .def("compute", &ReachableSet::compute)
+            // the computation runs purely in C++, thus the GIL is released so that other Python threads may proceed
+            .def("compute", &ReachableSet::compute,
+                 py::call_guard<py::gil_scoped_release>())
             .def("drivable_area_at_step", &ReachableSet::drivable_area_at_step)
             .def("reachable_set_at_step", &ReachableSet::reachable_set_at_step)
             .def("drivable_area", &ReachableSet::drivable_area)
             .def("reachable_set", &ReachableSet::reachable_set)
-            .def("prune_nodes_not_reaching_final_step", &ReachableSet::prune_nodes_not_reaching_final_step)
+            .def("prune_nodes_not_reaching_final_step", &ReachableSet::prune_nodes_not_reaching_final_step,
+                 py::call_guard<py::gil_scoped_release>())
             .def_readonly("map_step_to_drivable_area", &ReachableSet::map_step_to_drivable_area)
             .def_readonly("map_step_to_reachable_set", &ReachableSet::map_step_to_reachable_set);
 }
\ No newline at end of file
@@ -71,6 +71,17 @@ def list_rectangles_discritized():
     return list_rectangles_discritized
 
 
+@pytest.fixture
+def list_nodes_reach_overlapping():
+    """Provides reach nodes of which node 0 and 1 overlap, node 1 and 2 touch, and node 3 is disjoint from all others"""
+    list_bounds = [(0, 0, 2, 2), (1, 1, 3, 3), (3, 0, 4, 1), (10, 10, 11, 11)]
+    list_nodes_reach = [ReachNode(ReachPolygon.from_rectangle_vertices(p_lon_min, 0, p_lon_max, 1),
+                                  ReachPolygon.from_rectangle_vertices(p_lat_min, 0, p_lat_max, 1))
+                        for p_lon_min, p_lat_min, p_lon_max, p_lat_max in list_bounds]
+
+    return list_nodes_reach
+
+
 @pytest.fixture
 def reachable_set_py(config):
     return PyReachableSet(config)
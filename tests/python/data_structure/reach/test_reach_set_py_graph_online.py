@@ -1,4 +1,5 @@
 import os
+import pickle
 import shutil
 import tempfile
 import time
@@ -47,6 +48,25 @@ def test_validate_configurations():
     assert online_config.vehicle.ego.a_max == offline_config.vehicle.ego.a_max
 
 
+def test_validate_configurations_with_precomputed_offline_data(config):
+    # ensure configurations pickled by earlier versions can be loaded and validated
+    path_file_pickle = os.path.join(config.general.path_offline_data,
+                                    "offline_nt1_CART_amax6.0_vmax30.0_ms6_dx0.5_ver2024.1.2.pickle")
+    with open(path_file_pickle, "rb") as file_pickle:
+        dict_data = pickle.load(file_pickle)
+
+    reachset_config_offline = dict_data["config.reachable_set"]
+    vehicle_config_offline = dict_data["config.vehicle"]
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        PyGraphReachableSetOnline._validate_configurations(config.reachable_set, config.vehicle,
+                                                           reachset_config_offline, vehicle_config_offline)
+
+    assert config.reachable_set.size_grid == reachset_config_offline.size_grid
+    assert config.vehicle.ego.a_max == vehicle_config_offline.ego.a_max
+    assert config.vehicle.ego.v_lon_max == vehicle_config_offline.ego.v_lon_max
+
+
 def test_offline_reach():
     # ensure pickled data can be parsed by online reachability
     name_scenario = "DEU_Offline-1_1_T-1"
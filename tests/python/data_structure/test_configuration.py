@@ -0,0 +1,38 @@
+import logging
+
+import numpy as np
+import pytest
+from omegaconf import OmegaConf
+
+from commonroad_reach.data_structure.configuration import Configuration
+
+
+def test_vehicle_configuration_keeps_additional_parameters(config: Configuration, caplog):
+    config_omega = OmegaConf.merge(config.config_omega, {"vehicle": {"ego": {"length_trailer": 2.0}}})
+
+    with caplog.at_level(logging.WARNING):
+        config_vehicle = Configuration(config_omega).vehicle
+
+    assert config_vehicle.ego.length_trailer == 2.0
+    assert any("length_trailer" in record.getMessage() for record in caplog.records)
+
+
+def test_initial_state_arrays_follow_components(config: Configuration):
+    p_initial = config.planning.p_initial
+    p_initial[0] += 1.0
+    assert not np.isclose(config.planning.p_initial[0], p_initial[0])
+
+    config.planning.p_lon_initial += 1.0
+    assert np.isclose(config.planning.p_initial[0], p_initial[0])
+
+    config.planning.v_initial = (1.0, 2.0)
+    assert np.allclose(config.planning.v_initial, [1.0, 2.0])
+
+
+def test_invalid_vehicle_configuration_raises_upon_construction(config: Configuration):
+    # circumscribed inflation is only supported for reference point CENTER
+    config_omega = OmegaConf.merge(config.config_omega, {"planning": {"reference_point": "REAR"},
+                                                         "reachable_set": {"mode_inflation": 2}})
+
+    with pytest.raises(AssertionError):
+        Configuration(config_omega)
@@ -39,3 +39,12 @@ def test_compute_disc_radius_and_distance(id_type_vehicle, reference_point, rad_
 
     assert np.isclose(_rad, rad_expected)
     assert np.isclose(_dist, dist_expected)
+
+
+def test_compute_disc_radius_and_distance_repeated_calls():
+    # the second call is answered from the cache and has to return the same values
+    for _ in range(2):
+        _rad, _dist = util_configuration.compute_disc_radius_and_distance(4.5, 1.8, ref_point="CENTER")
+
+        assert np.isclose(_rad, 1.17154)
+        assert np.isclose(_dist, 3.0)
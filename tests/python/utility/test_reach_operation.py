@@ -185,6 +185,24 @@ def test_create_base_set_from_position_region():
         assert base_set_adapted.polygon_lat.contains(Point(vertex))
 
 
+@pytest.mark.parametrize("num_nodes_pairwise_overlap_max", [256, 0])
+def test_connected_reachset_py_returns_overlapping_nodes(monkeypatch, list_nodes_reach_overlapping: List[ReachNode],
+                                                         num_nodes_pairwise_overlap_max):
+    # exercises both the pairwise test and the spatial index
+    monkeypatch.setattr(reach_operation, "NUM_NODES_PAIRWISE_OVERLAP_MAX", num_nodes_pairwise_overlap_max)
+
+    dict_adjacency = reach_operation.connected_reachset_py(list_nodes_reach_overlapping, 2)
+
+    assert dict(dict_adjacency) == {0: [(0, 1)], 1: [(1, 0), (1, 2)], 2: [(2, 1)]}
+
+
+def test_determine_connected_components_groups_overlapping_nodes(list_nodes_reach_overlapping: List[ReachNode]):
+    list_connected_components = reach_operation.determine_connected_components(list_nodes_reach_overlapping)
+
+    assert [set(cc.list_nodes_reach) for cc in list_connected_components] == \
+           [set(list_nodes_reach_overlapping[:3]), {list_nodes_reach_overlapping[3]}]
+
+
 def test_point_mass_sample_containment(config: Configuration,plot=False):
     """Visualizes whether the reachable sets (lon/lat polygons) contain the propagated samples of the PM model"""
 